@@ -0,0 +1,57 @@
+"""Background queue for notification sends.
+
+Telegram calls block on a network round-trip; crawlers and test runs
+that emit many notifications end up serialized on that latency. The
+AsyncNotifier lets producers enqueue in O(1) while a daemon thread
+performs the actual sends, so notification I/O overlaps with crawling.
+flush() blocks until everything queued so far has been sent - call it
+before process exit so the daemon thread isn't killed mid-queue.
+"""
+
+import logging
+import queue
+import threading
+from typing import Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncNotifier:
+    """Dispatches queued notifications to sender callables off-thread"""
+
+    def __init__(
+        self,
+        senders: Dict[str, Callable[[str], None]],
+        maxsize: int = 256
+    ):
+        self._senders = senders
+        self._queue: 'queue.Queue[Tuple[str, str]]' = queue.Queue(maxsize)
+        self._worker = threading.Thread(
+            target=self._drain, daemon=True, name='async-notifier'
+        )
+        self._worker.start()
+
+    def enqueue(self, kind: str, payload: str):
+        """Queue one notification; drops (with a log) when the queue is
+        full rather than blocking the producer.
+        """
+        if kind not in self._senders:
+            raise ValueError(f"Unknown notification kind: {kind}")
+        try:
+            self._queue.put_nowait((kind, payload))
+        except queue.Full:
+            logger.warning(f"Notifier queue full, dropping {kind}")
+
+    def flush(self):
+        """Block until every queued notification has been attempted"""
+        self._queue.join()
+
+    def _drain(self):
+        while True:
+            kind, payload = self._queue.get()
+            try:
+                self._senders[kind](payload)
+            except Exception as e:
+                logger.error(f"Notification send failed ({kind}): {e}")
+            finally:
+                self._queue.task_done()
@@ -1,6 +1,10 @@
+import atexit
 import logging
+import queue
+import threading
 import time
 import os
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from pathlib import Path
@@ -11,16 +15,168 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 import functools
 from fake_useragent import UserAgent
 import random
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_driver_path() -> str:
+    """Resolve the chromedriver binary once per process.
+
+    ChromeDriverManager().install() re-checks its cache dir and may hit
+    the network on every call; with per-category browser restarts that
+    cost repeats needlessly. CHROMEDRIVER_PATH skips the manager
+    entirely for pinned environments.
+    """
+    path = os.environ.get('CHROMEDRIVER_PATH')
+    if path:
+        return path
+    return ChromeDriverManager().install()
+
+
+# One chromedriver process can host several sessions; sharing it saves
+# the launcher spawn + session negotiation (~500ms) every time a driver
+# is created or restarted. Lazily started, stopped at interpreter exit.
+_shared_service: Optional[Service] = None
+_shared_service_lock = threading.Lock()
+
+
+def _shared_service_url() -> str:
+    """Start (once) and return the URL of the shared chromedriver"""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            service = Service(_resolve_driver_path())
+            service.start()
+            atexit.register(service.stop)
+            _shared_service = service
+        return _shared_service.service_url
+
+
+def _new_chrome_driver(
+    options: Options,
+    share_service: bool = False
+) -> webdriver.Remote:
+    """Construct a Chrome driver.
+
+    share_service=True attaches the session to the process-wide
+    chromedriver instead of spawning a launcher per driver, and widens
+    the urllib3 pool behind RemoteConnection: the default single
+    connection serializes concurrent WebDriver calls (screenshot
+    capture overlapping scroll polling) and logs "connection pool is
+    full" churn. Only webdriver.Remote accepts a ClientConfig - the
+    Chrome constructor builds its connection internally - so the local
+    branch stays a plain construction.
+    """
+    if share_service:
+        url = _shared_service_url()
+        from selenium.webdriver.remote.client_config import ClientConfig
+        return webdriver.Remote(
+            command_executor=url,
+            options=options,
+            client_config=ClientConfig(
+                remote_server_addr=url,
+                init_args_for_pool_manager={'maxsize': 20}
+            )
+        )
+    return webdriver.Chrome(
+        service=Service(_resolve_driver_path()), options=options
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> Path:
+    """Create a directory once per process.
+
+    Cached so that spinning up many crawler instances doesn't re-stat
+    the same directory tree on every construction.
+    """
+    resolved = Path(path)
+    resolved.mkdir(parents=True, exist_ok=True)
+    return resolved
+
+
+# Single stealth payload installed once per driver via
+# Page.addScriptToEvaluateOnNewDocument — it runs before any page script
+# on every navigation, so anti-bot checks never observe pristine values
+# and no per-navigation patching round-trips are needed
+_STEALTH_JS = '''
+    Object.defineProperty(navigator, 'webdriver', {get: () => false});
+    Object.defineProperty(navigator, 'plugins', {get: () => [1,2,3,4,5]});
+    Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']});
+    window.chrome = { runtime: {} };
+    Object.defineProperty(navigator, 'permissions', {
+        get: () => ({
+            query: (p) => p.name === 'notifications' ?
+                Promise.resolve({ state: 'prompt' }) :
+                Promise.resolve({ state: 'granted' })
+        })
+    });
+    const _getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(p) {
+        if (p === 37445) return 'Intel Inc.';
+        if (p === 37446) return 'Intel Iris OpenGL Engine';
+        return _getParameter.call(this, p);
+    };
+'''
+
+# fake_useragent parses its bundled UA database on first use; share one
+# instance across all crawler constructions (matters for worker fan-out)
+_UA: Optional[UserAgent] = None
+
+
+def _random_user_agent() -> str:
+    """Return a random user agent from the module-cached UserAgent"""
+    global _UA
+    if _UA is None:
+        _UA = UserAgent()
+    return _UA.random
+
+
 class BaseCrawler:
     """Base crawler class with improved error handling and configuration management"""
-    
+
+    # Static launch arguments, hoisted so per-driver option building is
+    # a loop over a tuple rather than repeated string literals.
+    # Chrome only honors the last --disable-features flag, so every
+    # disabled feature lives in that one entry. The background-service
+    # disables keep per-instance RSS down for parallel capture workers.
+    CHROME_ARGS = (
+        # Anti-detection
+        '--disable-blink-features=AutomationControlled',
+        # Language settings for Korean sites
+        '--lang=ko-KR',
+        # Performance and stability
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--disable-features=VizDisplayCompositor,Translate,'
+        'MediaRouter,OptimizationHints',
+        '--disable-infobars',
+        '--disable-extensions',
+        '--start-maximized',
+        # Background services
+        '--disable-background-networking',
+        '--disable-sync',
+        '--disable-default-apps',
+        '--disable-component-update',
+        '--disable-notifications',
+        '--metrics-recording-only',
+        '--mute-audio',
+        '--no-first-run',
+        '--no-default-browser-check',
+    )
+
+    CHROME_PREFS = {
+        'intl.accept_languages': 'ko-KR,ko,en-US,en',
+        'credentials_enable_service': False,
+        'profile.password_manager_enabled': False,
+    }
+
+
     def __init__(
         self,
         name: str = "BaseCrawler",
@@ -60,12 +216,9 @@ class BaseCrawler:
     
     def setup_directories(self):
         """Setup required directories"""
-        self.data_dir = self.base_dir / self.name.lower()
-        self.log_dir = self.data_dir / 'logs'
-        self.screenshot_dir = self.data_dir / 'screenshots'
-        
-        for directory in [self.data_dir, self.log_dir, self.screenshot_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
+        self.data_dir = _ensure_dir(str(self.base_dir / self.name.lower()))
+        self.log_dir = _ensure_dir(str(self.data_dir / 'logs'))
+        self.screenshot_dir = _ensure_dir(str(self.data_dir / 'screenshots'))
     
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
@@ -76,7 +229,12 @@ class BaseCrawler:
         logger.handlers = []
         
         # File handler
-        log_file = self.log_dir / f"{self.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        # Include the pid so parallel capture workers started in the
+        # same second get separate log files instead of a shared handler
+        log_file = self.log_dir / (
+            f"{self.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            f"_{os.getpid()}.log"
+        )
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.INFO)
         
@@ -91,10 +249,17 @@ class BaseCrawler:
         )
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
-        
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
-        
+
+        # Route records through a queue so logger calls in hot loops are
+        # a lock-free put; the listener thread does the actual disk I/O
+        log_queue = queue.Queue(-1)
+        self._log_listener = QueueListener(
+            log_queue, file_handler, console_handler,
+            respect_handler_level=True
+        )
+        self._log_listener.start()
+        logger.addHandler(QueueHandler(log_queue))
+
         return logger
     
     def _init_driver(self):
@@ -102,9 +267,10 @@ class BaseCrawler:
         try:
             options = self._get_chrome_options()
             
-            # Use webdriver-manager to automatically download and manage ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            self.driver = _new_chrome_driver(
+                options,
+                share_service=self.config.get('share_driver_service', False)
+            )
             self.wait = WebDriverWait(self.driver, self.config.get('wait_timeout', 20))
             
             # Inject anti-detection JavaScript
@@ -118,29 +284,13 @@ class BaseCrawler:
     def _get_chrome_options(self) -> Options:
         """Get Chrome options with anti-detection settings"""
         options = Options()
-        
-        # Enhanced anti-detection
-        options.add_argument('--disable-blink-features=AutomationControlled')
+
+        for arg in self.CHROME_ARGS:
+            options.add_argument(arg)
         options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         options.add_experimental_option('useAutomationExtension', False)
-        
-        # Language settings for Korean sites
-        options.add_argument('--lang=ko-KR')
-        options.add_experimental_option('prefs', {
-            'intl.accept_languages': 'ko-KR,ko,en-US,en',
-            'credentials_enable_service': False,
-            'profile.password_manager_enabled': False
-        })
-        
-        # Performance and stability
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--disable-features=VizDisplayCompositor')
-        options.add_argument('--disable-infobars')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--start-maximized')
-        
+        options.add_experimental_option('prefs', dict(self.CHROME_PREFS))
+
         # New headless mode for Chrome >= 109
         if self.headless:
             options.add_argument('--headless=new')
@@ -149,9 +299,8 @@ class BaseCrawler:
             height = window_size.get('height', 1080)
             options.add_argument(f'--window-size={width},{height}')
         
-        # Random user agent
-        ua = UserAgent()
-        user_agent = self.config.get('user_agent', ua.random)
+        # Random user agent (cached instance, no re-parse per driver init)
+        user_agent = self.config.get('user_agent') or _random_user_agent()
         options.add_argument(f'user-agent={user_agent}')
         
         return options
@@ -160,25 +309,24 @@ class BaseCrawler:
         """Inject additional stealth JavaScript"""
         try:
             self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {get: () => false});
-                    Object.defineProperty(navigator, 'plugins', {get: () => [1,2,3,4,5]});
-                    window.chrome = { runtime: {} };
-                    Object.defineProperty(navigator, 'permissions', {
-                        get: () => ({
-                            query: (p) => p.name === 'notifications' ? 
-                                Promise.resolve({ state: 'prompt' }) : 
-                                Promise.resolve({ state: 'granted' })
-                        })
-                    });
-                '''
+                'source': _STEALTH_JS
             })
         except Exception as e:
             self.logger.warning(f"Could not inject stealth scripts: {e}")
     
     @staticmethod
-    def retry(max_attempts: int = 3, delay: int = 5):
-        """Decorator for retry logic"""
+    def retry(
+        max_attempts: int = 3,
+        delay: int = 5,
+        retryable: tuple = (TimeoutException, WebDriverException, ConnectionError)
+    ):
+        """Decorator for retry logic.
+
+        Only retries transient errors; programming errors (TypeError,
+        AttributeError, ...) propagate immediately instead of burning
+        max_attempts x delay on a bug that will never succeed. Backoff
+        is exponential to avoid hammering a rate-limited target.
+        """
         def decorator(func):
             @functools.wraps(func)
             def wrapper(self, *args, **kwargs):
@@ -186,7 +334,7 @@ class BaseCrawler:
                 for attempt in range(max_attempts):
                     try:
                         return func(self, *args, **kwargs)
-                    except Exception as e:
+                    except retryable as e:
                         last_exception = e
                         if hasattr(self, 'logger'):
                             self.logger.warning(
@@ -194,9 +342,9 @@ class BaseCrawler:
                             )
                         else:
                             print(f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}")
-                        
+
                         if attempt < max_attempts - 1:
-                            time.sleep(delay)
+                            time.sleep(delay * (2 ** attempt))
                 
                 if hasattr(self, 'logger'):
                     self.logger.error(f"All attempts failed for {func.__name__}")
@@ -212,8 +360,8 @@ class BaseCrawler:
             self.logger.info(f"Starting: {operation}")
             yield
             self.logger.info(f"Completed: {operation}")
-        except Exception as e:
-            self.logger.error(f"Failed: {operation} - {e}")
+        except Exception:
+            self.logger.exception(f"Failed: {operation}")
             self.take_screenshot(f"error_{operation}")
             raise
     
@@ -304,10 +452,9 @@ class BaseCrawler:
     def scroll_to_element(self, element):
         """Scroll to make element visible"""
         self.driver.execute_script(
-            "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
+            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
             element
         )
-        time.sleep(0.5)
     
     def take_screenshot(self, name: Optional[str] = None) -> str:
         """Take screenshot with automatic naming"""
@@ -332,6 +479,12 @@ class BaseCrawler:
         if self.driver:
             self.driver.quit()
             self.logger.info("Driver closed")
+
+        # Flush and stop the background log listener
+        listener = getattr(self, '_log_listener', None)
+        if listener:
+            listener.stop()
+            self._log_listener = None
     
     def __enter__(self):
         """Context manager entry"""
@@ -3,51 +3,144 @@
 Multi-category test for Olive Young Crawler
 """
 
+import argparse
+import io
+import os
+import sys
+from contextlib import contextmanager
+
 from oliveyoung_crawler_refactored import OliveYoungCrawler, RankingPeriod
 
-def main():
-    print("=" * 60)
-    print("Multi-Category Test - Olive Young Crawler")
-    print("=" * 60)
-    
-    # Test with multiple categories
-    test_categories = ["all", "bodycare"]
-    
+TEST_CATEGORIES = ["all", "bodycare"]
+
+BASE_DIR = '/Users/isy_mac_mini/Project/personal/oliveyoung/Data/multi_test'
+
+
+def capture_with_playwright(categories):
+    """Capture all categories concurrently via the Playwright path.
+
+    playwright_crawler fans the captures out with asyncio.gather under a
+    bounded semaphore, so the run is network-bound rather than O(n) in
+    browser navigations.
+    """
+    import playwright_crawler
+
+    pairs = [
+        (name, OliveYoungCrawler.CATEGORY_TABLE[name][1])
+        for name in categories
+        if name in OliveYoungCrawler.CATEGORY_TABLE
+    ]
+    results = playwright_crawler.capture_rankings(
+        pairs,
+        period=RankingPeriod.REALTIME.value,
+        output_dir=BASE_DIR,
+        max_concurrent=3
+    )
+    return {name: path for name, path in results.items() if path}
+
+
+@contextmanager
+def warm_crawler():
+    """One crawler (and Chrome process) shared by every capture in the
+    block; cleanup happens once at teardown instead of per capture.
+    """
     crawler = OliveYoungCrawler(
         headless=True,
         use_mobile=True,
         config={
-            'base_dir': '/Users/isy_mac_mini/Project/personal/oliveyoung/Data/multi_test',
+            'base_dir': BASE_DIR,
             'retry_attempts': 2,
             'retry_delay': 5
         }
     )
-    
     try:
-        print(f"\nCapturing {len(test_categories)} categories: {test_categories}")
+        yield crawler
+    finally:
+        crawler.cleanup()
+
+
+def capture_with_selenium(crawler, categories):
+    """Capture all categories on an already-warm Selenium crawler"""
+    return crawler.capture_all_rankings(
+        categories=categories,
+        period=RankingPeriod.REALTIME
+    )
+
+
+def capture_in_parallel(categories):
+    """Capture categories concurrently with one Chrome per worker.
+
+    Uses the crawler's process-pool path, so the categories overlap
+    instead of running back to back on a single browser.
+    """
+    return OliveYoungCrawler.capture_rankings_parallel(
+        categories=categories,
+        period=RankingPeriod.REALTIME,
+        max_workers=min(2, len(categories)),
+        config={
+            'base_dir': BASE_DIR,
+            'retry_attempts': 2,
+            'retry_delay': 5
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Multi-category capture test')
+    parser.add_argument(
+        '--playwright',
+        action='store_true',
+        help='Capture concurrently via the optional Playwright path'
+    )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Capture categories concurrently via the process pool'
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Multi-Category Test - Olive Young Crawler")
+    print("=" * 60)
+
+    try:
+        print(f"\nCapturing {len(TEST_CATEGORIES)} categories: {TEST_CATEGORIES}")
         print("-" * 40)
-        
-        results = crawler.capture_all_rankings(
-            categories=test_categories,
-            period=RankingPeriod.REALTIME
-        )
-        
+
+        if args.playwright:
+            results = capture_with_playwright(TEST_CATEGORIES)
+        elif args.parallel:
+            results = capture_in_parallel(TEST_CATEGORIES)
+        else:
+            with warm_crawler() as crawler:
+                results = capture_with_selenium(crawler, TEST_CATEGORIES)
+
         print("\n" + "=" * 60)
         print("RESULTS:")
         print("=" * 60)
-        
+
         if results:
             print(f"✅ Successfully captured {len(results)} categories:")
-            for category, path in results.items():
-                print(f"   - {category}: {path}")
+            print("\n".join(
+                f"   - {category}: {os.path.basename(path)}"
+                for category, path in results.items()
+            ))
         else:
             print("❌ No screenshots were captured")
-            
+
     except Exception as e:
         print(f"❌ Error: {e}")
-    
+
     finally:
         print("\n" + "=" * 60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Block-buffer stdout so the banner/progress prints are written in
+    # batches instead of one write syscall per line
+    sys.stdout = io.TextIOWrapper(
+        sys.stdout.buffer, line_buffering=False, write_through=False
+    )
+    try:
+        main()
+    finally:
+        sys.stdout.flush()
@@ -0,0 +1,113 @@
+"""Optional Playwright capture path for Olive Young rankings.
+
+Playwright's async API gives a native full-page screenshot
+(``page.screenshot(full_page=True)``, backed by CDP captureBeyondViewport)
+and lets several categories overlap in a single process, so the whole
+scroll/tile/merge pipeline collapses into one call per category. This
+module is a sidecar to the Selenium crawler, not a replacement: the
+Selenium path stays the default and this is only used when playwright is
+installed and explicitly requested.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # pragma: no cover - optional capture path
+    async_playwright = None
+
+from ranking_api import build_ranking_url
+
+logger = logging.getLogger(__name__)
+
+# Same id-based XPath as OliveYoungCrawler.RANKING_CONTAINER_XPATH.
+# Kept as a literal rather than imported: pulling in that module would
+# drag selenium into this optional playwright-only path.
+RANKING_CONTAINER_SELECTOR = 'xpath=//*[@id="main-inner-swiper-ranking"]'
+
+DEFAULT_NAV_TIMEOUT_MS = 30_000
+
+
+async def _capture_one(
+    context,
+    name: str,
+    category_code: Optional[str],
+    period: str,
+    output_dir: Path,
+    semaphore: asyncio.Semaphore
+) -> Optional[str]:
+    """Capture one category's ranking list to a PNG, returning the path"""
+    url = build_ranking_url(category_code, period)
+    async with semaphore:
+        page = await context.new_page()
+        try:
+            await page.goto(
+                url,
+                wait_until="networkidle",
+                timeout=DEFAULT_NAV_TIMEOUT_MS
+            )
+            output_path = output_dir / f"{name}_{period.lower()}.png"
+            container = page.locator(RANKING_CONTAINER_SELECTOR)
+            if await container.count():
+                await container.screenshot(path=str(output_path))
+            else:
+                await page.screenshot(path=str(output_path), full_page=True)
+            logger.info(f"Captured {name} -> {output_path.name}")
+            return str(output_path)
+        except Exception as e:
+            logger.error(f"Playwright capture failed for {name}: {e}")
+            return None
+        finally:
+            await page.close()
+
+
+async def _capture_all(
+    categories: List[Tuple[str, Optional[str]]],
+    period: str,
+    output_dir: Path,
+    headless: bool,
+    max_concurrent: int
+) -> Dict[str, Optional[str]]:
+    semaphore = asyncio.Semaphore(max_concurrent)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        context = await browser.new_context(**p.devices["iPhone 12"])
+        try:
+            results = await asyncio.gather(*[
+                _capture_one(context, name, code, period, output_dir,
+                             semaphore)
+                for name, code in categories
+            ])
+        finally:
+            await browser.close()
+    return {name: path for (name, _), path in zip(categories, results)}
+
+
+def capture_rankings(
+    categories: List[Tuple[str, Optional[str]]],
+    period: str = "REALTIME",
+    output_dir: str = "Ranking_Screenshots",
+    headless: bool = True,
+    max_concurrent: int = 3
+) -> Dict[str, Optional[str]]:
+    """Capture ranking screenshots for multiple categories concurrently.
+
+    Takes (name, category_code) pairs — category_code None means the
+    overall ranking — and returns a mapping of name -> screenshot path
+    (None for failed captures). Raises RuntimeError when playwright is
+    not installed so callers can fall back to the Selenium capture path.
+    """
+    if async_playwright is None:
+        raise RuntimeError(
+            "playwright is required for this capture path "
+            "(pip install playwright && playwright install chromium)"
+        )
+
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    return asyncio.run(
+        _capture_all(categories, period, out, headless, max_concurrent)
+    )
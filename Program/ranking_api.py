@@ -0,0 +1,95 @@
+"""Async HTTP client for Olive Young ranking endpoints.
+
+Pulls ranking pages directly over HTTP in parallel instead of driving a
+headless browser. Used as the fast path by OliveYoungCrawler; Selenium
+screenshot capture remains available as a fallback.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional fast path
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+# Same endpoint/query params as OliveYoungCrawler's browser URLs
+RANKING_BASE_URL = "https://m.oliveyoung.co.kr/m/mtn"
+
+MOBILE_USER_AGENT = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) "
+    "AppleWebKit/605.1.15 (KHTML, like Gecko) "
+    "Version/15.0 Mobile/15E148 Safari/604.1"
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": MOBILE_USER_AGENT,
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+
+def build_ranking_url(
+    category_code: Optional[str] = None,
+    period: str = "REALTIME"
+) -> str:
+    """Build a ranking page URL for a category code and period"""
+    params = (
+        "menu=ranking&t_page=home&t_click=GNB&t_gnb_type=ranking"
+        "&t_swiping_type=N&tab=sales"
+    )
+    if category_code:
+        params += f"&category={category_code}"
+    params += f"&period={period}"
+    return f"{RANKING_BASE_URL}?{params}"
+
+
+async def _fetch_all(
+    urls: List[str],
+    total_timeout: float,
+    max_connections: int
+) -> List[Optional[str]]:
+    """Fetch all URLs concurrently, returning response bodies in order"""
+    limits = httpx.Limits(max_connections=max_connections)
+    timeout = httpx.Timeout(total_timeout)
+
+    async with httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        limits=limits,
+        timeout=timeout,
+        follow_redirects=True
+    ) as client:
+
+        async def fetch_one(url: str) -> Optional[str]:
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                return response.text
+            except httpx.HTTPError as e:
+                logger.warning(f"Fetch failed for {url}: {e}")
+                return None
+
+        return await asyncio.gather(*[fetch_one(url) for url in urls])
+
+
+def fetch_rankings(
+    urls: List[str],
+    total_timeout: float = 30.0,
+    max_connections: int = 5
+) -> Dict[str, Optional[str]]:
+    """Fetch ranking pages for multiple URLs in one batched run.
+
+    Returns a mapping of url -> response body (None for failed fetches).
+    Raises RuntimeError when httpx is not installed so callers can fall
+    back to the browser-based capture path.
+    """
+    if httpx is None:
+        raise RuntimeError(
+            "httpx is required for the HTTP ranking fetch path "
+            "(pip install httpx)"
+        )
+
+    bodies = asyncio.run(_fetch_all(urls, total_timeout, max_connections))
+    return dict(zip(urls, bodies))
@@ -8,10 +8,18 @@ from selenium.webdriver.common.by import By
 # import tools  # Commented out as we're simplifying
 import math
 import functools
+import random
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import json
 from datetime import datetime
-import pickle
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 
 class GetCurrencyError(Exception):
@@ -24,15 +32,18 @@ class SeleniumBot:
         def decorator(func):
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                attempts = 0
-                while attempts < max_attempts:
+                for attempt in range(max_attempts):
                     try:
                         return func(*args, **kwargs)
                     except Exception as e:
-                        attempts += 1
-                        print(f"Attempt {attempts} failed with error: {e}. Retrying...")
-                        time.sleep(delay)
-                return func(*args, **kwargs)
+                        if attempt + 1 >= max_attempts:
+                            raise
+                        # Exponential backoff with jitter so repeated
+                        # failures back off instead of hammering the site
+                        wait = delay * (2 ** attempt) + random.uniform(0, 0.5)
+                        print(f"Attempt {attempt + 1} failed with error: {e}. "
+                              f"Retrying in {wait:.1f}s...")
+                        time.sleep(wait)
             return wrapper
         return decorator
 
@@ -40,6 +51,17 @@ class SeleniumBot:
     def __init__(self, username = 'ilsun', headless = True, platform = 'nas'):
         self.folder = os.path.join(os.getcwd(), "Data")  # Simplified folder path
         self.driver = self._init_driver(headless)
+        # Shared HTTP session: keep-alive skips the TCP+TLS handshake on
+        # repeated downloads from the same host, with a few retries for
+        # transient failures
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
         self.wait = WebDriverWait(self.driver, 20)
         self.username = username
         self.lterm = 10
@@ -121,21 +143,23 @@ class SeleniumBot:
             print("No alert present or alert handling timed out.")
 
     def wait_for_element(self, by, value, timeout=10):
-        time.sleep(1)
-        # Wait for the element to be clickable for the specified timeout
+        # Wait for the element to be clickable for the specified timeout;
+        # WebDriverWait polls every 500ms and returns as soon as it holds
         return WebDriverWait(self.driver, timeout).until(EC.element_to_be_clickable((by, value)))
 
     def wait_for_elements(self, by, value, timeout=10):
-        time.sleep(1)
         # Wait for all elements located by the specified method and value to be clickable
         return WebDriverWait(self.driver, timeout).until(EC.visibility_of_all_elements_located((by, value)))
 
     def download_image(self, image_url, save_path):
-        response = requests.get(image_url)
-        if response.status_code == 200:
-            with open(save_path, 'wb') as file:
+        # Stream to disk in chunks so peak memory stays independent of
+        # image size; the shared session reuses the connection
+        with self._session.get(image_url, stream=True, timeout=(3, 30)) as response:
+            if response.status_code == 200:
+                with open(save_path, 'wb') as file:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        file.write(chunk)
                 print(f"Image downloaded to {save_path}, from {image_url}")
-                file.write(response.content)
 
     def click_via_javascript(self, by, value, timeout=10):
         try:
@@ -154,7 +178,7 @@ class SeleniumBot:
             # If the element is not found within the timeout period
             return False
         
-    retry(max_attempts=3, delay=5)
+    @retry(max_attempts=3, delay=5)
     def get_currency(self, currency='USD'):
 
         try :
@@ -168,6 +192,9 @@ class SeleniumBot:
             print(e)
             print(f"get_currency : error!")
             self.send_photo(message="get_currency : error!")
+            # Re-raise so the retry decorator's backoff actually runs;
+            # swallowing here would turn every failure into value=None
+            raise GetCurrencyError(f"get_currency failed for {currency}: {e}") from e
 
 
     def send_photo(self, message, path=None):
@@ -205,11 +232,24 @@ class SeleniumBot:
         WebDriverWait(self.driver, self.sterm).until(EC.element_to_be_clickable((by, element_id))).click()
 
 
+    # Only the fields add_cookie actually needs; everything else in
+    # get_cookies() output is a redundant default
+    COOKIE_FIELDS = ("name", "value", "domain", "path", "expiry",
+                     "secure", "httpOnly", "sameSite")
+
     def save_cookies(self, cookie_path):
+        # JSON instead of pickle: faster, human-readable, and loading a
+        # tampered cookie file can't execute arbitrary code
         try:
-            cookies = self.driver.get_cookies()
+            cookies = [
+                {k: c.get(k) for k in self.COOKIE_FIELDS}
+                for c in self.driver.get_cookies()
+            ]
             with open(cookie_path, "wb") as cookie_file:
-                pickle.dump(cookies, cookie_file)
+                if orjson is not None:
+                    cookie_file.write(orjson.dumps(cookies))
+                else:
+                    cookie_file.write(json.dumps(cookies).encode("utf-8"))
             print(f"Cookies saved : {cookie_path}")
         except Exception as e:
             print(f"Error saving cookies: {e}")
@@ -218,10 +258,13 @@ class SeleniumBot:
         try:
             self.driver.delete_all_cookies()
             with open(cookie_path, "rb") as cookie_file:
-                cookies = pickle.load(cookie_file)
+                raw = cookie_file.read()
+            cookies = orjson.loads(raw) if orjson is not None else json.loads(raw)
             for cookie in cookies:
-                self.driver.add_cookie(cookie)
+                self.driver.add_cookie(
+                    {k: v for k, v in cookie.items() if v is not None}
+                )
 
-            print(f"Cookie loaded: {cookie}")
+            print(f"Cookies loaded: {cookie_path}")
         except Exception as e:
             print(f"Error loading cookies: {e}")
\ No newline at end of file
@@ -4,44 +4,94 @@
 새로운 코드에서는 core 모듈 사용을 권장
 """
 
+import asyncio
+import functools
 import os
 import json
+import threading
 import warnings
 from typing import Any, Dict, Optional
 
 # 새로운 코어 모듈 임포트
 from core import config_manager, TelegramBot, Logger
 
-# 레거시 호환성을 위한 전역 설정
-script_directory = os.path.dirname(os.path.abspath(__file__))
-conf = os.path.join(script_directory, 'config.json')
+from async_notifier import AsyncNotifier
+
+
+@functools.lru_cache(maxsize=None)
+def _script_dir() -> str:
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def __getattr__(name: str):
+    # 레거시 호환성을 위한 전역 설정 - 임포트 시점이 아니라 실제로
+    # 접근할 때 경로를 해석함 (대부분의 임포트는 이 값을 쓰지 않음)
+    if name == 'script_directory':
+        return _script_dir()
+    if name == 'conf':
+        return os.path.join(_script_dir(), 'config.json')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# deprecation 경고는 호출마다가 아니라 함수당 한 번만 발생
+# (warnings.warn은 매 호출 스택 추적 비용이 있음)
+_warned = set()
+
+def _warn_once(name: str, message: str):
+    if name not in _warned:
+        _warned.add(name)
+        warnings.warn(message, DeprecationWarning, stacklevel=3)
 
 def load_config():
     """레거시: 설정 로드 (권장하지 않음 - config_manager 사용 권장)"""
-    warnings.warn(
-        "load_config()는 deprecated입니다. core.config_manager를 사용하세요.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_once(
+        "load_config",
+        "load_config()는 deprecated입니다. core.config_manager를 사용하세요."
     )
     return config_manager._config
 
 def fjson(user: str, *args) -> Any:
     """레거시: 설정값 가져오기 (권장하지 않음 - config_manager.get() 사용 권장)"""
-    warnings.warn(
-        "fjson()는 deprecated입니다. config_manager.get()을 사용하세요.",
-        DeprecationWarning,
-        stacklevel=2
+    _warn_once(
+        "fjson",
+        "fjson()는 deprecated입니다. config_manager.get()을 사용하세요."
     )
     try:
         return config_manager.get(user, *args)
     except Exception:
         raise Exception(f"Error loading config: {args}")
 
+# 텔레그램 비동기 호출용 백그라운드 이벤트 루프 (daemon 스레드에서 상시 실행)
+# - 호출마다 asyncio.run으로 루프를 새로 만들지 않음
+# - create_task 방식과 달리 태스크 참조가 유지되어 GC로 유실되지 않음
+_bg_loop = None
+_bg_loop_lock = threading.Lock()
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, daemon=True)
+            thread.start()
+            _bg_loop = loop
+        return _bg_loop
+
 def folder_maker(folder: str, *args):
-    """폴더 생성 유틸리티 (계속 사용 가능)"""
-    os.makedirs(folder, exist_ok=True)
-    for arg in args:
-        os.makedirs(os.path.join(folder, arg), exist_ok=True)
+    """폴더 생성 유틸리티 (계속 사용 가능)
+
+    makedirs는 부모 디렉토리를 함께 만들기 때문에, 다른 경로의
+    상위에 해당하는 경로는 건너뛰어 syscall 횟수를 줄인다.
+    """
+    paths = {os.path.join(folder, arg) for arg in args}
+    paths.add(folder)
+    # 더 깊은 경로가 있으면 그 조상 경로는 자동으로 생성됨
+    targets = [
+        p for p in paths
+        if not any(other != p and other.startswith(p + os.sep) for other in paths)
+    ]
+    for p in targets:
+        if not os.path.isdir(p):
+            os.makedirs(p, exist_ok=True)
 
 class MyBot:
     """
@@ -50,60 +100,93 @@ class MyBot:
     """
     
     def __init__(self, token: str, id: str):
-        warnings.warn(
-            "MyBot은 deprecated입니다. core.TelegramBot을 사용하세요.",
-            DeprecationWarning,
-            stacklevel=2
+        _warn_once(
+            "MyBot",
+            "MyBot은 deprecated입니다. core.TelegramBot을 사용하세요."
         )
-        
+
         self.token = token
         self.id = id
         self.telegram_bot = TelegramBot(token, id)
         self.value = None
-    
+        self._doc_bot = None  # send_document용 Bot 인스턴스 재사용
+        # 전송은 백그라운드 큐에서 처리 - 호출자는 네트워크 왕복을
+        # 기다리지 않음. 종료 전 flush() 호출로 잔여 큐를 비울 것.
+        self._notifier = AsyncNotifier({
+            'message': self._send_message_now,
+            'photo': self._send_photo_now,
+            'document': self._send_document_now,
+        })
+
     def send_message(self, text: str):
+        """메시지 전송 (큐에 적재 후 즉시 반환)"""
+        self._notifier.enqueue('message', text)
+
+    def send_photo(self, path: str):
+        """사진 전송 (큐에 적재 후 즉시 반환)"""
+        self._notifier.enqueue('photo', path)
+
+    def send_document(self, path: str):
+        """문서 전송 (큐에 적재 후 즉시 반환)"""
+        self._notifier.enqueue('document', path)
+
+    def flush(self):
+        """큐에 남은 알림이 모두 전송될 때까지 대기"""
+        self._notifier.flush()
+
+    def _send_message_now(self, text: str):
         """메시지 전송"""
         try:
             self.telegram_bot.send_message_sync(text)
         except Exception as e:
             print(f"메시지 전송 실패: {e}")
-    
-    def send_photo(self, path: str):
+
+    def _send_photo_now(self, path: str):
         """사진 전송"""
         try:
             self.telegram_bot.send_photo_sync(path)
         except Exception as e:
             print(f"사진 전송 실패: {e}")
-    
-    def send_document(self, path: str):
+
+    def _send_document_now(self, path: str):
         """문서 전송"""
         try:
-            if os.path.exists(path):
-                # 임시로 기본 Bot 사용
-                import asyncio
+            if not os.path.exists(path):
+                return
+
+            # Bot 인스턴스는 한 번만 만들어 재사용 (TLS 연결 재활용)
+            if self._doc_bot is None:
                 from telegram import Bot
-                
-                bot = Bot(self.token)
-                
-                async def send_doc():
-                    with open(path, 'rb') as doc:
-                        await bot.send_document(chat_id=self.id, document=doc)
-                
-                try:
-                    loop = asyncio.get_running_loop()
-                    loop.create_task(send_doc())
-                except RuntimeError:
-                    asyncio.run(send_doc())
-                    
+                self._doc_bot = Bot(self.token)
+            bot = self._doc_bot
+
+            async def send_doc():
+                with open(path, 'rb') as doc:
+                    await bot.send_document(chat_id=self.id, document=doc)
+
+            # 상시 실행 중인 백그라운드 루프에 제출하고 완료를 기다림 -
+            # fire-and-forget create_task처럼 태스크가 유실되지 않음
+            future = asyncio.run_coroutine_threadsafe(
+                send_doc(), _get_bg_loop()
+            )
+            future.result(timeout=60)
+
         except Exception as e:
             print(f"문서 전송 실패: {e}")
 
 # 기존 코드 호환성을 위한 전역 변수
+# (이미 파싱된 설정을 그대로 참조 - deprecated 래퍼/경고 비용 없음)
 try:
-    config = load_config()
-except:
+    config = config_manager._config
+except Exception:
     config = {}
 
+# 마이그레이션이 끝난 대량 호출 환경에서는 deprecation 래퍼 자체를
+# 건너뛸 수 있음 - 경고/try-except 비용 없이 바로 config_manager 접근
+if os.environ.get("TOOLS_SILENCE_DEPRECATION"):
+    fjson = config_manager.get
+    load_config = lambda: config_manager._config
+
 # 마이그레이션 가이드 출력
 def show_migration_guide():
     """마이그레이션 가이드 출력"""